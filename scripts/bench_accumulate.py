@@ -1,12 +1,22 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
 # © James Ross Ω FLYING•ROBOTS <https://github.com/flyingrobots>
+import bisect
+import functools
 import subprocess
 import json
+import operator
 import statistics
 import sys
+from array import array
+from collections import defaultdict
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib parser
+    orjson = None
+
 ROOT = Path(".").resolve()
 CRITERION = ROOT / "target" / "criterion"
 OUT_JSON = ROOT / "docs" / "benchmarks" / "data-raw-accumulated.json"
@@ -19,11 +29,38 @@ GROUPS = [
 ]
 INPUTS = [10, 100, 1000, 3000, 10000, 30000]
 
-def run_bench():
-    # Run cargo bench with reduced time (1s) to make 10 runs feasible
-    cmd = ["cargo", "bench", "-p", "warp-benches", "--", "--measurement-time", "1"]
-    # Stream output to console so user sees progress; capture stderr for error reporting
-    subprocess.run(cmd, check=True, capture_output=False)
+def _read_json(path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+def _write_json(path, obj):
+    # array("d") sample buffers serialize as plain JSON lists
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, default=list))
+    else:
+        path.write_text(json.dumps(obj, separators=(",", ":"), default=list))
+
+def run_bench(quiet=False):
+    # Only the two targets that produce GROUPS are run, and criterion skips
+    # regenerating its HTML plots, which nothing here reads. Note that
+    # --measurement-time only applies to groups that don't set their own;
+    # snapshot_hash and scheduler_drain configure theirs in code.
+    cmd = [
+        "cargo", "bench", "-p", "warp-benches",
+        "--bench", "snapshot_hash",
+        "--bench", "scheduler_drain",
+        "--",
+        "--measurement-time", "1",
+        "--noplot",
+    ]
+    if quiet:
+        # Criterion's per-benchmark report is thousands of lines; after the
+        # first run, drop it and keep only stderr for error reporting
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    else:
+        # Stream output to console so user sees progress
+        subprocess.run(cmd, check=True, capture_output=False)
 
 def extract_samples(run_idx):
     data = []
@@ -36,17 +73,17 @@ def extract_samples(run_idx):
                 continue
             
             try:
-                content = json.loads(path.read_text())
+                content = _read_json(path)
                 iters = content["iters"]
                 times = content["times"]
 
-                # Validate lengths match before zipping
+                # Validate lengths match before dividing
                 if len(times) != len(iters):
                     print(f"Warning: {path}: times/iters length mismatch ({len(times)} vs {len(iters)})", file=sys.stderr)
                     continue
 
-                # Calculate time per iteration (ns)
-                samples_ns = [t / i for t, i in zip(times, iters, strict=True)]
+                # Calculate time per iteration (ns), held as unboxed doubles
+                samples_ns = array("d", map(operator.truediv, times, iters))
 
                 data.append({
                     "group": group,
@@ -62,14 +99,18 @@ def extract_samples(run_idx):
                 print(f"Value error reading {path}: {e}", file=sys.stderr)
     return data
 
+# _UNITS[i] applies from _THRESHOLDS[i - 1] (inclusive) up to _THRESHOLDS[i]
+_THRESHOLDS = (1e3, 1e6, 1e9)
+_UNITS = (
+    (1, "ns"),
+    (1e3, "µs"),
+    (1e6, "ms"),
+    (1e9, "s"),
+)
+
 def fmt_ns(ns):
-    if ns < 1000:
-        return f"{ns:.2f} ns"
-    if ns < 1e6:
-        return f"{ns/1000:.2f} µs"
-    if ns < 1e9:
-        return f"{ns/1e6:.2f} ms"
-    return f"{ns/1e9:.2f} s"
+    scale, unit = _UNITS[bisect.bisect_right(_THRESHOLDS, ns)]
+    return "%.2f %s" % (ns / scale, unit)
 
 def main():
     accumulated = []
@@ -78,7 +119,7 @@ def main():
     for i in range(1, 11):
         print(f"Run {i}/10...", end="", flush=True)
         try:
-            run_bench()
+            run_bench(quiet=i > 1)
             run_data = extract_samples(i)
             accumulated.extend(run_data)
             print(" Done.")
@@ -92,16 +133,14 @@ def main():
         
     # Save raw accumulated
     OUT_JSON.parent.mkdir(parents=True, exist_ok=True)
-    OUT_JSON.write_text(json.dumps(accumulated, separators=( ",", ":")))
+    _write_json(OUT_JSON, accumulated)
     print(f"\nSaved accumulated data to {OUT_JSON}")
     
     # Process for Median Table
-    grouped = {}
+    # One unboxed float64 buffer per (group, n) of time per iteration (ns)
+    grouped = defaultdict(functools.partial(array, "d"))
     for entry in accumulated:
-        key = (entry["group"], entry["n"])
-        if key not in grouped:
-            grouped[key] = []
-        grouped[key].extend(entry["samples_ns"])
+        grouped[(entry["group"], entry["n"])].extend(entry["samples_ns"])
         
     print("\n### Benchmark Results (Median of 10 runs)\n")
     print("| Group | Input (n) | Median Time | Samples |")
@@ -110,11 +149,10 @@ def main():
     # Sort groups for consistent order
     for group in GROUPS:
         for n in INPUTS:
-            key = (group, n)
-            if key not in grouped:
+            samples = grouped.get((group, n))
+            if not samples:
                 continue
-            
-            samples = grouped[key]
+
             med_ns = statistics.median(samples)
             count = len(samples)
             val_str = fmt_ns(med_ns)
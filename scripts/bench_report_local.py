@@ -1,12 +1,28 @@
 #!/usr/bin/env python3
 # SPDX-License-Identifier: Apache-2.0
 # © James Ross Ω FLYING•ROBOTS <https://github.com/flyingrobots>
+import argparse
+import bisect
+import functools
+import glob
+import itertools
 import json
-import statistics
+import operator
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib parser
+    orjson = None
+
 CRITERION = Path("target/criterion")
+# Per-file summaries from earlier runs; lives under target/ so `cargo clean`
+# discards it along with the data it describes
+CACHE = CRITERION / ".bench_report_local-cache.json"
 
 GROUPS = [
     "snapshot_hash",
@@ -16,62 +32,231 @@ GROUPS = [
 ]
 INPUTS = [10, 100, 1000, 3000, 10000, 30000]
 
-def fmt_ns(ns):
-    if ns < 1000:
-        return f"{ns:.2f} ns"
-    elif ns < 1e6:
-        return f"{ns/1000:.2f} µs"
-    elif ns < 1e9:
-        return f"{ns/1e6:.2f} ms"
-    else:
-        return f"{ns/1e9:.2f} s"
+_HEADER = (
+    "### Benchmark Results (Median from latest run)\n",
+    "| Group | Input (n) | Median Time | Samples |",
+    "| :--- | :--- | :--- | :--- |",
+)
+_ROW = "| %s | %d | %s | %d |"
+# Per-file phases reported by --profile
+_PHASES = ("stat", "read", "parse", "median")
 
-def main():
-    print("### Benchmark Results (Median from latest run)\n")
-    print("| Group | Input (n) | Median Time | Samples |")
-    print("| :--- | :--- | :--- | :--- |")
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
+def _index_samples():
+    # One glob per group instead of speculatively opening new/ and base/
+    # for every input size. Maps (group, n, kind) -> sample.json path; the
+    # fixed depth keeps e.g. scheduler_drain/enqueue/* out of
+    # scheduler_drain's entries.
+    index = {}
     for group in GROUPS:
-        for n in INPUTS:
-            # We look for 'new/sample.json' which is the latest run
-            path = CRITERION / group / str(n) / "new" / "sample.json"
-            
-            if not path.exists():
-                # Fallback to 'base/sample.json' if 'new' doesn't exist
-                path = CRITERION / group / str(n) / "base" / "sample.json"
-            
-            if not path.exists():
-                continue
-
-            try:
-                content = json.loads(path.read_text())
-                iters = content["iters"]
-                times = content["times"]
-
-                # Validate lengths match before zipping
-                if len(times) != len(iters):
-                    print(f"# Warning: {path}: times/iters length mismatch", file=sys.stderr)
-                    continue
+        group_dir = str(CRITERION / group)
+        for path in glob.iglob(f"{group_dir}/*/*/sample.json"):
+            kind_dir = os.path.dirname(path)
+            n_dir = os.path.dirname(kind_dir)
+            index[(group, os.path.basename(n_dir), os.path.basename(kind_dir))] = path
+    return index
+
+def _load_cache():
+    # {path: [mtime_ns, size, median_ns, count]} from a previous run
+    try:
+        cache = _loads(CACHE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    # Drop anything hand-edited or corrupted rather than trusting it later
+    return {
+        k: v
+        for k, v in cache.items()
+        if isinstance(v, list)
+        and len(v) == 4
+        and all(isinstance(x, (int, float)) for x in v)
+    }
+
+def _save_cache(cache):
+    if not CRITERION.is_dir():
+        return
+    if orjson is not None:
+        data = orjson.dumps(cache)
+    else:
+        data = json.dumps(cache, separators=(",", ":")).encode("utf-8")
+    tmp = CACHE.with_name(CACHE.name + ".tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, CACHE)
+    except OSError as e:
+        print(f"# Could not write cache {CACHE}: {e}", file=sys.stderr)
+
+# _UNITS[i] applies from _THRESHOLDS[i - 1] (inclusive) up to _THRESHOLDS[i]
+_THRESHOLDS = (1e3, 1e6, 1e9)
+_UNITS = (
+    (1, "ns"),
+    (1e3, "µs"),
+    (1e6, "ms"),
+    (1e9, "s"),
+)
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_scaled(unit_idx, value):
+    return "%.2f %s" % (value, _UNITS[unit_idx][1])
+
+def fmt_ns(ns):
+    # Memoized on the exact scaled value, so output is identical to the
+    # plain formatter in bench_accumulate.py; repeated medians hit the cache.
+    unit_idx = bisect.bisect_right(_THRESHOLDS, ns)
+    return _fmt_scaled(unit_idx, ns / _UNITS[unit_idx][0])
+
+def _median_sorted(s):
+    # Same result as statistics.median for a non-empty, already sorted list
+    # of floats, without its generic numeric-type handling or extra copy
+    m = len(s) // 2
+    return s[m] if len(s) & 1 else (s[m - 1] + s[m]) / 2
+
+def _warn(msg):
+    # One write per message: print() emits the text and the newline
+    # separately, so lines from worker threads could run together
+    sys.stderr.write(msg + "\n")
 
-                # Calculate time per iteration (ns)
-                samples_ns = [t / i for t, i in zip(times, iters, strict=True)]
+def _report_row(group, n, path, cache, fresh, timings):
+    # Returns the table row for one (group, n), or None if it has no usable
+    # sample; problems are reported on stderr. Summaries that had to be
+    # recomputed are recorded in `fresh` for the on-disk cache, and per-phase
+    # nanoseconds (see _PHASES) are appended to `timings`.
+    clock = time.perf_counter_ns
+    t_start = clock()
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            t_stat = t_read = t_parse = clock()
+            stamp = [st.st_mtime_ns, st.st_size]
+            hit = cache.get(path)
+            if hit is not None and hit[:2] == stamp:
+                # Unchanged since the last report; skip the read and parse
+                med_ns, count = hit[2], hit[3]
+            else:
+                # Regular file: one read sized from fstat returns all of it,
+                # without going through a buffered file object.
+                data = os.read(fd, st.st_size)
+                t_read = clock()
+                content = _loads(data)
+                t_parse = clock()
+                if not isinstance(content, dict):
+                    _warn(f"# Unexpected JSON layout in {path}")
+                    return None
+                iters = content.get("iters")
+                times = content.get("times")
+                if iters is None or times is None:
+                    missing = "iters" if iters is None else "times"
+                    _warn(f"# Missing key in {path}: '{missing}'")
+                    return None
 
-                if not samples_ns:
-                    continue
+                # Validate lengths match before dividing
+                if len(times) != len(iters):
+                    _warn(f"# Warning: {path}: times/iters length mismatch")
+                    return None
+                if not times:
+                    return None
+
+                # Calculate time per iteration (ns); sorted() consumes the
+                # map directly, so the samples are materialized only once
+                samples_ns = sorted(map(operator.truediv, times, iters))
 
-                med_ns = statistics.median(samples_ns)
+                med_ns = _median_sorted(samples_ns)
                 count = len(samples_ns)
-                val_str = fmt_ns(med_ns)
-
-                print(f"| {group} | {n} | {val_str} | {count} |")
-            except json.JSONDecodeError as e:
-                print(f"# Failed to parse {path}: {e}", file=sys.stderr)
-            except KeyError as e:
-                print(f"# Missing key in {path}: {e}", file=sys.stderr)
-            except ValueError as e:
-                print(f"# Value error in {path}: {e}", file=sys.stderr)
-            except OSError as e:
-                print(f"# IO error reading {path}: {e}", file=sys.stderr)
+                fresh[path] = [*stamp, med_ns, count]
+        finally:
+            os.close(fd)
+
+        # list.append is atomic, so worker threads can share `timings`
+        timings.append((
+            t_stat - t_start,
+            t_read - t_stat,
+            t_parse - t_read,
+            clock() - t_parse,
+        ))
+        return _ROW % (group, n, fmt_ns(med_ns), count)
+    except json.JSONDecodeError as e:
+        _warn(f"# Failed to parse {path}: {e}")
+    except ValueError as e:
+        # e.g. UnicodeDecodeError from the stdlib parser on non-UTF-8 bytes
+        _warn(f"# Value error in {path}: {e}")
+    except OSError as e:
+        _warn(f"# IO error reading {path}: {e}")
+    return None
+
+def _write_stdout(buf):
+    # Hand the finished report to fd 1 directly, bypassing sys.stdout's
+    # text layer; os.write may take only part of a large buffer on a pipe.
+    view = memoryview(buf)
+    while view:
+        view = view[os.write(1, view):]
+
+def _format_profile(index_ns, timings):
+    totals = [index_ns, *map(sum, zip(*timings))] if timings else [index_ns, 0, 0, 0, 0]
+    grand = sum(totals) or 1
+    return " | ".join(
+        "%s: %.2f ms (%d%%)" % (name, ns / 1e6, round(100 * ns / grand))
+        for name, ns in zip(("index", *_PHASES), totals)
+    )
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Print a Markdown table of median times from target/criterion.",
+        epilog=(
+            "Per-file summaries are cached in\n"
+            f"  {CACHE}\n"
+            "so unchanged sample.json files are not re-parsed. Delete that file\n"
+            "to force a full re-parse."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="report time spent per phase (index, stat, read, parse, median) on stderr",
+    )
+    args = parser.parse_args()
+
+    # Collect the whole table and emit it with a single write at the end
+    rows = list(_HEADER)
+
+    # We look for 'new/sample.json' which is the latest run, falling back to
+    # 'base/sample.json' if 'new' doesn't exist
+    t_index = time.perf_counter_ns()
+    index = _index_samples()
+    index_ns = time.perf_counter_ns() - t_index
+    tasks = []
+    for group, n in itertools.product(GROUPS, INPUTS):
+        path = index.get((group, str(n), "new")) or index.get((group, str(n), "base"))
+        if path is not None:
+            tasks.append((group, n, path))
+
+    cache = _load_cache()
+    fresh = {}
+    timings = []
+
+    # Each (group, n) is an independent read + parse; overlap them on a
+    # thread pool. map() yields results in task order, so the table order
+    # is unchanged.
+    with ThreadPoolExecutor() as pool:
+        for row in pool.map(lambda task: _report_row(*task, cache, fresh, timings), tasks):
+            if row is not None:
+                rows.append(row)
+
+    if fresh:
+        cache.update(fresh)
+        _save_cache(cache)
+
+    _write_stdout(("\n".join(rows) + "\n").encode("utf-8"))
+
+    if args.profile:
+        # Worker phases are summed across threads, so they can exceed wall time
+        print(f"# profile: {_format_profile(index_ns, timings)}", file=sys.stderr)
 
 if __name__ == "__main__":
     main()
@@ -2228,15 +2228,18 @@ fn load_criterion_estimate(
     let candidate_paths =
         ["new", "base", "change"].map(|kind| bench_dir.join(kind).join("estimates.json"));
     for path in &candidate_paths {
-        if !path.exists() {
-            continue;
-        }
-        let contents = std::fs::read_to_string(path).map_err(|err| {
-            (
-                display_repo_relative(path, repo_root),
-                format!("read error: {err}"),
-            )
-        })?;
+        // Missing kinds are the common case; let the read itself report that
+        // instead of paying for a separate exists() stat first.
+        let contents = match std::fs::read_to_string(path) {
+            Ok(contents) => contents,
+            Err(err) if err.kind() == std::io::ErrorKind::NotFound => continue,
+            Err(err) => {
+                return Err((
+                    display_repo_relative(path, repo_root),
+                    format!("read error: {err}"),
+                ));
+            }
+        };
         let value: serde_json::Value = serde_json::from_str(&contents).map_err(|err| {
             (
                 display_repo_relative(path, repo_root),
@@ -2303,18 +2306,21 @@ fn bake_benchmark_report(
     policy_payload: &PolicyMatrixPayload,
     repo_root: &Path,
 ) -> Result<String> {
-    let mut html = inline_benchmark_vendor_styles(template, repo_root)?;
+    let html = inline_benchmark_vendor_styles(template, repo_root)?;
     let inject = build_benchmark_inline_script(core_data, core_missing, policy_payload)?;
-    if html.contains(BENCH_INLINE_DATA_MARKER) {
-        html = html.replacen(
-            BENCH_INLINE_DATA_MARKER,
-            &(inject + BENCH_INLINE_DATA_MARKER),
-            1,
-        );
-    } else {
-        html = html.replace("</body>", &(inject + "</body>"));
-    }
-    Ok(html)
+    Ok(inject_benchmark_inline_script(&html, &inject))
+}
+
+fn inject_benchmark_inline_script(html: &str, inject: &str) -> String {
+    let Some(marker_index) = html.find(BENCH_INLINE_DATA_MARKER) else {
+        return html.replace("</body>", &format!("{inject}</body>"));
+    };
+
+    let mut result = String::with_capacity(html.len() + inject.len());
+    result.push_str(&html[..marker_index]);
+    result.push_str(inject);
+    result.push_str(&html[marker_index..]);
+    result
 }
 
 fn inline_benchmark_vendor_styles(template: &str, repo_root: &Path) -> Result<String> {
@@ -9159,6 +9165,99 @@ mod tests {
         );
     }
 
+    #[test]
+    fn inject_benchmark_inline_script_splices_before_data_marker() {
+        let html = format!("<head></head>\n{BENCH_INLINE_DATA_MARKER}1];</script>\n</body>");
+        let baked = inject_benchmark_inline_script(&html, "<script>INJECT</script>\n");
+
+        assert_eq!(
+            baked,
+            format!(
+                "<head></head>\n<script>INJECT</script>\n{BENCH_INLINE_DATA_MARKER}1];</script>\n</body>"
+            )
+        );
+    }
+
+    #[test]
+    fn inject_benchmark_inline_script_falls_back_to_closing_body() {
+        let baked = inject_benchmark_inline_script("<body><p>report</p></body>", "<script/>");
+
+        assert_eq!(baked, "<body><p>report</p><script/></body>");
+    }
+
+    fn write_criterion_estimate_fixture(bench_dir: &Path, kind: &str, mean: f64) {
+        let dir = bench_dir.join(kind);
+        assert_ok(fs::create_dir_all(&dir), "create estimate fixture dir");
+        assert_ok(
+            fs::write(
+                dir.join("estimates.json"),
+                format!(
+                    r#"{{"mean":{{"point_estimate":{mean},"confidence_interval":{{"lower_bound":1.0,"upper_bound":9.0}}}}}}"#
+                ),
+            ),
+            "write estimate fixture",
+        );
+    }
+
+    #[test]
+    fn load_criterion_estimate_falls_through_missing_kinds() {
+        let root = unique_temp_path("xtask-criterion-estimate-fallthrough");
+        let base_only = root.join("base_only");
+        let change_only = root.join("change_only");
+        write_criterion_estimate_fixture(&base_only, "base", 2.5);
+        write_criterion_estimate_fixture(&change_only, "change", 4.5);
+
+        let base = load_criterion_estimate(&base_only, &root);
+        let change = load_criterion_estimate(&change_only, &root);
+        let missing = load_criterion_estimate(&root.join("absent"), &root);
+        fs::remove_dir_all(&root).ok();
+
+        let base = assert_ok(base.map_err(|(path, msg)| format!("{path}: {msg}")), "base");
+        assert_eq!(base.path, "base_only/base/estimates.json");
+        assert_eq!(base.mean.to_bits(), 2.5_f64.to_bits());
+        assert_eq!(base.lb.map(f64::to_bits), Some(1.0_f64.to_bits()));
+        assert_eq!(base.ub.map(f64::to_bits), Some(9.0_f64.to_bits()));
+
+        let change = assert_ok(
+            change.map_err(|(path, msg)| format!("{path}: {msg}")),
+            "change",
+        );
+        assert_eq!(change.path, "change_only/change/estimates.json");
+        assert_eq!(change.mean.to_bits(), 4.5_f64.to_bits());
+
+        let Err((path, message)) = missing else {
+            unreachable!("expected missing estimate to be reported");
+        };
+        assert_eq!(path, "absent/new/estimates.json");
+        assert_eq!(message, "not found (tried new/base/change)");
+    }
+
+    #[test]
+    fn load_criterion_estimate_reports_non_not_found_read_errors() {
+        let root = unique_temp_path("xtask-criterion-estimate-read-error");
+        let bench_dir = root.join("case");
+        // A directory where the file should be fails the read with something
+        // other than NotFound, which must not fall through to `base`.
+        assert_ok(
+            fs::create_dir_all(bench_dir.join("new").join("estimates.json")),
+            "create unreadable estimate fixture",
+        );
+        write_criterion_estimate_fixture(&bench_dir, "base", 2.5);
+
+        let result = load_criterion_estimate(&bench_dir, &root);
+        fs::remove_dir_all(&root).ok();
+
+        let (path, message) = match result {
+            Ok(estimate) => unreachable!("expected read error, got {estimate:?}"),
+            Err(err) => err,
+        };
+        assert_eq!(path, "case/new/estimates.json");
+        assert!(
+            message.starts_with("read error:"),
+            "expected read error, got: {message}"
+        );
+    }
+
     #[test]
     fn collect_policy_matrix_rows_errors_on_malformed_policy_case() {
         let unique = std::time::SystemTime::now()